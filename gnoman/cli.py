@@ -5,11 +5,11 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any, Optional, Sequence
 
 from . import __version__
-from .core import AuditManager, ContractManager, SafeManager, SecretsManager, SyncManager, WalletManager
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -113,11 +113,13 @@ def _build_parser() -> argparse.ArgumentParser:
 
 
 def _handle_secrets(args: argparse.Namespace) -> Any:
+    from .core import SecretsManager
+
     manager = SecretsManager()
     command = args.secrets_command
     if command == "list":
         records = manager.list(namespace=args.namespace, include_values=args.values)
-        return [record.__dict__ for record in records]
+        return [asdict(record) for record in records]
     if command == "add":
         manager.add(service=args.service, username=args.username, secret=args.secret)
         return {"status": "added"}
@@ -131,6 +133,8 @@ def _handle_secrets(args: argparse.Namespace) -> Any:
 
 
 def _handle_wallet(args: argparse.Namespace) -> Any:
+    from .core import WalletManager
+
     manager = WalletManager()
     command = args.wallet_command
     if command == "list":
@@ -175,12 +179,16 @@ def _handle_wallet(args: argparse.Namespace) -> Any:
 
 
 def _handle_audit(args: argparse.Namespace) -> Any:
+    from .core import AuditManager
+
     manager = AuditManager()
     path = manager.run_audit(output=args.output, encrypt_passphrase=args.encrypt)
     return {"path": str(path)}
 
 
 def _handle_sync(args: argparse.Namespace) -> Any:
+    from .core import SyncManager
+
     root = Path(args.root) if args.root else None
     manager = SyncManager(root=root)
     report = manager.reconcile(update_env=not args.no_env, update_keyring=not args.no_keyring)
@@ -193,6 +201,8 @@ def _handle_sync(args: argparse.Namespace) -> Any:
 
 
 def _handle_contract(args: argparse.Namespace) -> Any:
+    from .core import ContractManager
+
     manager = ContractManager()
     summary = manager.load_contract(path=args.path, name=args.name, address=args.address)
     return {
@@ -204,6 +214,8 @@ def _handle_contract(args: argparse.Namespace) -> Any:
 
 
 def _handle_safe(args: argparse.Namespace) -> Any:
+    from .core import SafeManager
+
     manager = SafeManager()
     command = args.safe_command
     if command == "deploy":
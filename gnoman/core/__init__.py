@@ -1,26 +1,70 @@
 """Core managers powering GNOMAN."""
 
-from .abi_manager import (
-    list_abis,
-    load_abi,
-    save_abi,
-    send_transaction,
-    simulate_call,
-)
-from .audit_manager import AuditManager
-from .contract_manager import ContractManager
-from .log_manager import log_event
-from .safe_manager import SafeManager
-from .secrets_manager import SecretRecord, SecretsManager
-from .sync_manager import SyncManager
-from .wallet_manager import WalletManager
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .abi_manager import (
+        list_abis,
+        load_abi,
+        save_abi,
+        save_abi_binary,
+        send_transaction,
+        simulate_call,
+        simulate_calls,
+    )
+    from .audit_manager import AuditManager
+    from .contract_manager import ContractManager
+    from .log_manager import log_event
+    from .safe_manager import SafeManager
+    from .secrets_manager import SecretRecord, SecretsManager
+    from .sync_manager import SyncManager
+    from .wallet_manager import WalletManager
+
+# Several managers import web3/eth-account at module load. Resolve exports on
+# first access so callers only pay for the subsystems they actually touch.
+_EXPORTS = {
+    "list_abis": ".abi_manager",
+    "load_abi": ".abi_manager",
+    "save_abi": ".abi_manager",
+    "save_abi_binary": ".abi_manager",
+    "send_transaction": ".abi_manager",
+    "simulate_call": ".abi_manager",
+    "simulate_calls": ".abi_manager",
+    "AuditManager": ".audit_manager",
+    "ContractManager": ".contract_manager",
+    "SafeManager": ".safe_manager",
+    "SecretRecord": ".secrets_manager",
+    "SecretsManager": ".secrets_manager",
+    "SyncManager": ".sync_manager",
+    "WalletManager": ".wallet_manager",
+    "log_event": ".log_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "list_abis",
     "load_abi",
     "save_abi",
+    "save_abi_binary",
     "send_transaction",
     "simulate_call",
+    "simulate_calls",
     "AuditManager",
     "ContractManager",
     "SafeManager",
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from eth_utils import to_checksum_address
 from web3 import Web3
@@ -14,41 +14,85 @@ from web3.exceptions import Web3Exception
 
 from ..audit import append_record
 
+try:  # pragma: no cover - optional dependency
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - JSON snapshots only
+    msgpack = None  # type: ignore[assignment]
+
 
 ABI_DIRECTORY = Path.home() / ".gnoman" / "abis"
 
+# Directory listings and parsed ABIs, reused until the directory or file on
+# disk changes (keyed by modification time, and size for files).
+_LIST_CACHE: Dict[Path, Tuple[int, Tuple[str, ...], List[str]]] = {}
+_LOAD_CACHE: Dict[Path, Tuple[int, int, List[Dict[str, Any]]]] = {}
+
 
 def _ensure_storage() -> None:
     ABI_DIRECTORY.mkdir(parents=True, exist_ok=True)
 
 
-def _abi_path(name: str) -> Path:
+def _abi_suffixes() -> Tuple[str, ...]:
+    # MessagePack snapshots take precedence when the library can read them.
+    return (".msgpack", ".json") if msgpack is not None else (".json",)
+
+
+def _abi_path(name: str, suffix: str = ".json") -> Path:
     safe_name = name.strip()
+    for known in (".json", ".msgpack"):
+        if safe_name.endswith(known):
+            safe_name = safe_name[: -len(known)]
+            break
     if not safe_name:
         raise ValueError("ABI name must be a non-empty string")
-    if not safe_name.endswith(".json"):
-        safe_name = f"{safe_name}.json"
-    return (ABI_DIRECTORY / safe_name).resolve()
+    return (ABI_DIRECTORY / f"{safe_name}{suffix}").resolve()
 
 
 def list_abis() -> List[str]:
     """Return the known ABI entries sorted alphabetically."""
 
     _ensure_storage()
-    entries = []
-    for path in ABI_DIRECTORY.glob("*.json"):
-        entries.append(path.stem)
-    return sorted(entries)
+    mtime = ABI_DIRECTORY.stat().st_mtime_ns
+    suffixes = _abi_suffixes()
+    cached = _LIST_CACHE.get(ABI_DIRECTORY)
+    if cached is None or cached[0] != mtime or cached[1] != suffixes:
+        entries = sorted({path.stem for path in ABI_DIRECTORY.iterdir() if path.suffix in suffixes})
+        cached = _LIST_CACHE[ABI_DIRECTORY] = (mtime, suffixes, entries)
+    return list(cached[2])
+
+
+def _write_snapshot(name: str, suffix: str, data: bytes) -> Path:
+    _ensure_storage()
+    path = _abi_path(name, suffix)
+    path.write_bytes(data)
+    _LOAD_CACHE.pop(path, None)
+    # Only one snapshot per name: drop the other format so it cannot shadow this one.
+    for other in (".json", ".msgpack"):
+        if other != suffix:
+            other_path = _abi_path(name, other)
+            other_path.unlink(missing_ok=True)
+            _LOAD_CACHE.pop(other_path, None)
+    # Filesystems with coarse timestamps may not move the directory or file
+    # mtimes, so drop the cached entries rather than trusting stat.
+    _LIST_CACHE.pop(ABI_DIRECTORY, None)
+    return path
 
 
 def save_abi(name: str, abi_payload: Any) -> Path:
     """Persist an ABI payload to disk."""
 
-    _ensure_storage()
-    path = _abi_path(name)
     normalised = _normalise_payload(abi_payload)
-    path.write_text(json.dumps(normalised, ensure_ascii=False, indent=2), encoding="utf-8")
-    return path
+    text = json.dumps(normalised, ensure_ascii=False, indent=2)
+    return _write_snapshot(name, ".json", text.encode("utf-8"))
+
+
+def save_abi_binary(name: str, abi_payload: Any) -> Path:
+    """Persist an ABI payload as MessagePack, or JSON when msgpack is missing."""
+
+    if msgpack is None:
+        return save_abi(name, abi_payload)
+    normalised = _normalise_payload(abi_payload)
+    return _write_snapshot(name, ".msgpack", msgpack.packb(normalised, use_bin_type=True))
 
 
 def _normalise_payload(payload: Any) -> Dict[str, Any]:
@@ -75,11 +119,24 @@ def _normalise_abi(entries: Any) -> List[Dict[str, Any]]:
 def load_abi(name: str) -> List[Dict[str, Any]]:
     """Load an ABI definition from disk."""
 
-    path = _abi_path(name)
-    if not path.exists():
+    for suffix in _abi_suffixes():
+        path = _abi_path(name, suffix)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        break
+    else:
         raise FileNotFoundError(f"ABI '{name}' is not stored in {ABI_DIRECTORY}")
-    payload = json.loads(path.read_text(encoding="utf-8"))
-    return _normalise_payload(payload)["abi"]
+    cached = _LOAD_CACHE.get(path)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        if suffix == ".msgpack":
+            payload = msgpack.unpackb(path.read_bytes(), raw=False)
+        else:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        abi = _normalise_payload(payload)["abi"]
+        cached = _LOAD_CACHE[path] = (stat.st_mtime_ns, stat.st_size, abi)
+    return [dict(entry) for entry in cached[2]]
 
 
 def load_abi_from_file(path: str | Path) -> List[Dict[str, Any]]:
@@ -191,6 +248,50 @@ def simulate_call(w3: Web3, address: str, abi_data: Sequence[Dict[str, Any]], me
         raise
 
 
+def _execute_batch(w3: Web3, functions: Sequence[ContractFunction]) -> Optional[List[Any]]:
+    batch_requests = getattr(w3, "batch_requests", None)
+    if batch_requests is None:  # web3 < 7 has no JSON-RPC batching
+        return None
+    try:
+        with batch_requests() as batch:
+            for function in functions:
+                batch.add(function)
+            return list(batch.execute())
+    except Exception:
+        # Providers such as EthereumTesterProvider reject batches outright;
+        # callers fall back to one request per call.
+        return None
+
+
+def simulate_calls(
+    w3: Web3,
+    address: str,
+    abi_data: Sequence[Dict[str, Any]],
+    calls: Sequence[Tuple[str, Sequence[str]]],
+) -> List[Dict[str, Any]]:
+    """Perform several read-only calls, sent as one JSON-RPC batch when possible."""
+
+    try:
+        functions = [_build_contract_function(w3, address, abi_data, method, args) for method, args in calls]
+    except Exception:
+        # Bad methods or arguments go through simulate_call so the failure
+        # is audited and raised exactly as for a single call.
+        functions = []
+    results = _execute_batch(w3, functions) if len(functions) > 1 else None
+    if results is None:
+        return [
+            {"method": method, **simulate_call(w3, address, abi_data, method, args)}
+            for method, args in calls
+        ]
+    timestamp = datetime.now(timezone.utc).isoformat()
+    payloads: List[Dict[str, Any]] = []
+    for (method, _), result in zip(calls, results):
+        payload = {"method": method, "result": _serialise_result(result), "timestamp": timestamp}
+        _append_audit("abi.test", {"method": method, "contract": address, "mode": "call"}, True, payload)
+        payloads.append(payload)
+    return payloads
+
+
 def send_transaction(
     w3: Web3,
     private_key: str,
@@ -262,8 +363,10 @@ __all__ = [
     "load_abi_from_file",
     "load_store",
     "save_abi",
+    "save_abi_binary",
     "send_transaction",
     "simulate_call",
+    "simulate_calls",
     "update_store",
 ]
 
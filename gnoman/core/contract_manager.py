@@ -15,7 +15,7 @@ from web3.providers.eth_tester import EthereumTesterProvider
 from .log_manager import log_event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContractSummary:
     """Metadata describing a loaded contract."""
 
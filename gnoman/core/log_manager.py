@@ -9,13 +9,11 @@ from pathlib import Path
 from typing import Any, Dict
 
 from ..utils.crypto_tools import sign_payload
-from ..utils.env_tools import get_gnoman_home
+from ..utils.env_tools import ensure_gnoman_home
 
 
 def _log_path() -> Path:
-    base = get_gnoman_home()
-    base.mkdir(parents=True, exist_ok=True)
-    return base / "gnoman_audit.jsonl"
+    return ensure_gnoman_home() / "gnoman_audit.jsonl"
 
 
 def log_event(action: str, **payload: Any) -> None:
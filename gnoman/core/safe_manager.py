@@ -9,7 +9,7 @@ from typing import List, Optional
 from .log_manager import log_event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SafeDeployment:
     """Result of a Safe deployment."""
 
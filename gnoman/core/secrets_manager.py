@@ -9,7 +9,7 @@ from ..utils import keyring_backend
 from .log_manager import log_event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SecretRecord:
     """Materialised representation of a stored secret."""
 
@@ -50,6 +50,17 @@ class SecretsManager:
                 )
         return result
 
+    def get(self, *, service: str, username: str) -> Optional[SecretRecord]:
+        entry = keyring_backend.get_entry(service, username)
+        if entry is None:
+            return None
+        return SecretRecord(
+            service=entry.service,
+            username=entry.username,
+            secret=entry.secret,
+            metadata=entry.metadata,
+        )
+
     def add(self, *, service: str, username: str, secret: str) -> None:
         keyring_backend.set_entry(service, username, secret)
         log_event("secret-add", service=service, username=username)
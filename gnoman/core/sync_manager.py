@@ -11,7 +11,7 @@ from ..utils.env_tools import env_file_paths
 from .log_manager import log_event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SyncReport:
     """Detailed reconciliation results."""
 
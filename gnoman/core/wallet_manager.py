@@ -8,10 +8,12 @@ import secrets
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from eth_account import Account
 from eth_account.messages import encode_defunct
+from eth_keys import keys
+from eth_utils import keccak, to_checksum_address
 from web3 import Web3
 from web3.providers.eth_tester import EthereumTesterProvider
 
@@ -28,6 +30,11 @@ except Exception:  # pragma: no cover - dependency may be absent during tests
     Bip32Slip10Secp256k1 = None  # type: ignore[assignment]
     Bip39MnemonicGenerator = None  # type: ignore[assignment]
 
+try:  # pragma: no cover - optional dependency
+    from coincurve import PublicKey as _CoincurvePublicKey
+except Exception:  # pragma: no cover - fall back to eth-keys
+    _CoincurvePublicKey = None  # type: ignore[assignment]
+
 from ..utils import keyring_backend
 from ..utils.crypto_tools import decrypt_with_passphrase, encrypt_with_passphrase
 from ..utils.env_tools import get_gnoman_home
@@ -41,7 +48,43 @@ DEFAULT_DERIVATION_PATH = "m/44'/60'/0'/0/0"
 KEYRING_SERVICE = "gnoman.wallet"
 
 
-@dataclass
+def _address_bytes(private_key: bytes) -> bytes:
+    """Return the 20-byte address for *private_key* without building an account."""
+
+    if _CoincurvePublicKey is not None:
+        public_key = _CoincurvePublicKey.from_secret(private_key).format(compressed=False)[1:]
+        return keccak(public_key)[-20:]
+    return keys.PrivateKey(private_key).public_key.to_canonical_address()
+
+
+def _balance_payload(address: str, balance_wei: int, nonce: int) -> Dict[str, object]:
+    return {
+        "address": address,
+        "balance_wei": balance_wei,
+        "balance_eth": Web3.from_wei(balance_wei, "ether"),
+        "nonce": nonce,
+    }
+
+
+def _batch_balances(client: Web3, addresses: Sequence[str]) -> Optional[List[Tuple[int, int]]]:
+    """Fetch ``(balance, nonce)`` per address in one JSON-RPC batch, or ``None``."""
+
+    batch_requests = getattr(client, "batch_requests", None)
+    if batch_requests is None:  # web3 < 7 has no JSON-RPC batching
+        return None
+    try:
+        with batch_requests() as batch:
+            for address in addresses:
+                batch.add(client.eth.get_balance(address))
+                batch.add(client.eth.get_transaction_count(address))
+            results = list(batch.execute())
+    except Exception:
+        # EthereumTesterProvider and some RPC endpoints reject batches.
+        return None
+    return [(int(results[i]), int(results[i + 1])) for i in range(0, len(results), 2)]
+
+
+@dataclass(slots=True, frozen=True)
 class WalletRecord:
     """Stored metadata for a managed wallet."""
 
@@ -295,12 +338,33 @@ class WalletManager:
         balance_wei = client.eth.get_balance(account.address)
         nonce = client.eth.get_transaction_count(account.address)
         log_event("wallet.balance", label=label, balance=str(balance_wei))
-        return {
-            "address": account.address,
-            "balance_wei": balance_wei,
-            "balance_eth": Web3.from_wei(balance_wei, "ether"),
-            "nonce": nonce,
-        }
+        return _balance_payload(account.address, balance_wei, nonce)
+
+    def balances(self, *, labels: Sequence[str]) -> Dict[str, Dict[str, object]]:
+        """Return ``balance`` payloads for several wallets keyed by label.
+
+        Balance and nonce lookups go out as a single JSON-RPC batch when the
+        provider supports it, otherwise one request pair per wallet.
+        """
+
+        if len(labels) < 2:
+            return {label: self.balance(label=label) for label in labels}
+        client = self._get_web3()
+        if client is None:
+            return {label: self.balance(label=label) for label in labels}
+        addresses = [self._load_account(label).address for label in labels]
+        results = _batch_balances(client, addresses)
+        if results is None:
+            # Keep the derived addresses; only the RPC calls are repeated singly.
+            results = [
+                (client.eth.get_balance(address), client.eth.get_transaction_count(address))
+                for address in addresses
+            ]
+        payloads: Dict[str, Dict[str, object]] = {}
+        for label, address, (balance_wei, nonce) in zip(labels, addresses, results):
+            log_event("wallet.balance", label=label, balance=str(balance_wei))
+            payloads[label] = _balance_payload(address, balance_wei, nonce)
+        return payloads
 
     def rotate_labels(self, *, labels: Iterable[str]) -> int:
         store = self._load_store()
@@ -331,29 +395,36 @@ class WalletManager:
     ) -> Dict[str, object]:
         """Search for an address that matches ``pattern`` and return the key material."""
 
-        candidate = pattern.strip().lstrip("0x")
+        candidate = pattern.strip()
+        if candidate[:2].lower() == "0x":
+            candidate = candidate[2:]
         if not candidate:
             raise ValueError("Pattern must contain at least one hexadecimal nibble")
         if not all(ch in "0123456789abcdefABCDEF" for ch in candidate):
             raise ValueError("Pattern must be hexadecimal")
 
-        target = candidate if case_sensitive else candidate.lower()
+        # Compare raw lowercase hex first; checksum casing is only computed
+        # for the rare candidate that already matches the nibbles.
+        target = candidate.lower()
+        width = len(candidate)
         attempts = 0
         while attempts < max_attempts:
             attempts += 1
             private_key = secrets.token_bytes(32)
-            account = Account.from_key(private_key)
-            address = account.address[2:]
-            haystack = address if case_sensitive else address.lower()
-            if haystack.startswith(target):
-                payload = {
-                    "address": account.address,
-                    "private_key": private_key.hex(),
-                    "attempts": attempts,
-                    "pattern": pattern,
-                }
-                log_event("wallet.vanity", pattern=pattern, attempts=attempts, address=account.address)
-                return payload
+            raw = _address_bytes(private_key)
+            if not raw.hex().startswith(target):
+                continue
+            address = to_checksum_address(raw)
+            if case_sensitive and address[2 : 2 + width] != candidate:
+                continue
+            payload = {
+                "address": address,
+                "private_key": private_key.hex(),
+                "attempts": attempts,
+                "pattern": pattern,
+            }
+            log_event("wallet.vanity", pattern=pattern, attempts=attempts, address=address)
+            return payload
         raise RuntimeError("Unable to find matching vanity address within attempt limit")
 
 
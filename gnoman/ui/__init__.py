@@ -1,6 +1,36 @@
 """User interface components for GNOMAN."""
 
-from .simple_gui import SimpleGUI, launch as launch_simple_gui
-from .terminal import TerminalUI, launch_terminal
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .simple_gui import SimpleGUI, launch as launch_simple_gui
+    from .terminal import TerminalUI, launch_terminal
+
+# Each interface drags in its own toolkit (tkinter or prompt_toolkit/web3), so
+# only import the one that is actually requested.
+_EXPORTS = {
+    "SimpleGUI": (".simple_gui", "SimpleGUI"),
+    "launch_simple_gui": (".simple_gui", "launch"),
+    "TerminalUI": (".terminal", "TerminalUI"),
+    "launch_terminal": (".terminal", "launch_terminal"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(importlib.import_module(module_name, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = ["SimpleGUI", "TerminalUI", "launch_simple_gui", "launch_terminal"]
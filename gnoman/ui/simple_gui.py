@@ -2,23 +2,120 @@
 
 from __future__ import annotations
 
+import bisect
+import sys
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox, simpledialog, ttk
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from ..core import SecretsManager
+from ..core import SecretRecord, SecretsManager
+
+
+def _sort_key(record: SecretRecord) -> Tuple[str, str]:
+    return (record.service.casefold(), record.username.casefold())
+
+
+class _AddSecretDialog(tk.Toplevel):
+    """Modal form collecting service, username and secret in one step."""
+
+    FIELDS = (("Service namespace:", ""), ("Username:", ""), ("Secret value:", "*"))
+
+    def __init__(self, parent: tk.Misc) -> None:
+        super().__init__(parent)
+        self.title("Add Secret")
+        self.transient(parent)
+        self.resizable(False, False)
+        self.result: Optional[Tuple[str, str, str]] = None
+
+        form = ttk.Frame(self, padding=12)
+        form.pack(fill=tk.BOTH, expand=True)
+        self._entries: List[ttk.Entry] = []
+        for row, (label, show) in enumerate(self.FIELDS):
+            ttk.Label(form, text=label).grid(row=row, column=0, sticky=tk.W, pady=2)
+            entry = ttk.Entry(form, width=36, show=show)
+            entry.grid(row=row, column=1, sticky=tk.EW, padx=(8, 0), pady=2)
+            self._entries.append(entry)
+
+        buttons = ttk.Frame(form)
+        buttons.grid(row=len(self.FIELDS), column=0, columnspan=2, sticky=tk.E, pady=(12, 0))
+        ttk.Button(buttons, text="OK", command=self._submit).pack(side=tk.LEFT, padx=(0, 8))
+        ttk.Button(buttons, text="Cancel", command=self._cancel).pack(side=tk.LEFT)
+
+        self.bind("<Return>", self._submit)
+        self.bind("<Escape>", self._cancel)
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+        self._entries[0].focus_set()
+        # X11 refuses a grab on a window that is not mapped yet.
+        self.wait_visibility()
+        self.grab_set()
+
+    def _submit(self, _event: Optional[tk.Event] = None) -> None:
+        service, username, secret = (entry.get() for entry in self._entries)
+        self.result = (service, username, secret)
+        self.destroy()
+
+    def _cancel(self, _event: Optional[tk.Event] = None) -> None:
+        self.destroy()
+
+    def show(self) -> Optional[Tuple[str, str, str]]:
+        """Block until the form is dismissed and return its values, if any."""
+
+        self.wait_window()
+        return self.result
 
 
 class SimpleGUI:
     """Expose core secret management features through a desktop window."""
 
+    # Rows patched per Tk idle callback so large vaults never block the UI.
+    APPLY_CHUNK = 50
+    # Seconds a keyring listing is reused before hitting the backend again.
+    LIST_TTL = 2.0
+    # Milliseconds a Refresh click waits so a burst of clicks loads once.
+    REFRESH_DEBOUNCE_MS = 150
+    # Milliseconds between checks on a background keyring load.
+    LOAD_POLL_MS = 50
+    # Minimum seconds between throttled (progress) status bar updates.
+    STATUS_INTERVAL = 0.1
+    # Plaintext is only fetched on demand, so every row shows the same mask.
+    MASK = "••••••••"
+    # (column id, heading, width) for the secrets tree.
+    COLUMNS = (
+        ("service", "Service", 200),
+        ("username", "Username", 200),
+        ("secret", "Secret (masked)", 250),
+    )
+    # (label, handler method) for the button bar, left to right.
+    BUTTONS = (
+        ("Refresh", "_schedule_refresh"),
+        ("Show Secret", "show_secret"),
+        ("Add Secret", "add_secret"),
+        ("Delete Secret", "delete_secret"),
+        ("Rotate", "rotate_secrets"),
+    )
+
     def __init__(self, *, root: Optional[tk.Tk] = None) -> None:
         self.root = root or tk.Tk()
         self.root.title("GNOMAN — Simple GUI")
         self.root.geometry("720x420")
-        self.status_var = tk.StringVar(value="Ready")
         self.manager = SecretsManager()
-        self._items: Dict[str, tuple[str, str, Optional[str]]] = {}
+        # Keyring backends can block for a long time; list them off the Tk thread.
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gnoman-gui")
+        # (service, username) -> tree item id; the single record of what is shown.
+        self._rows: Dict[Tuple[str, str], str] = {}
+        # Reverse of ``_rows`` for selection lookups; both share each key tuple.
+        self._keys: Dict[str, Tuple[str, str]] = {}
+        self._apply_token = 0
+        self._loading = False
+        self._reload_pending = False
+        self._streaming = False
+        self._refresh_after_id: Optional[str] = None
+        self._status_shown_at = 0.0
+        self._pending_status: Optional[str] = None
+        self._status_flush_id: Optional[str] = None
+        self._list_cache: Optional[Tuple[float, List[SecretRecord]]] = None
         self._build_layout()
         self.refresh_secrets()
 
@@ -51,162 +148,297 @@ class SimpleGUI:
 
         self.tree = ttk.Treeview(
             tree_container,
-            columns=("service", "username", "secret"),
+            columns=tuple(name for name, _, _ in self.COLUMNS),
             show="headings",
             height=12,
         )
-        self.tree.heading("service", text="Service")
-        self.tree.heading("username", text="Username")
-        self.tree.heading("secret", text="Secret (masked)")
-        self.tree.column("service", width=200, anchor=tk.W, stretch=True)
-        self.tree.column("username", width=200, anchor=tk.W, stretch=True)
-        self.tree.column("secret", width=250, anchor=tk.W, stretch=True)
+        set_heading, set_column = self.tree.heading, self.tree.column
+        for name, title, width in self.COLUMNS:
+            set_heading(name, text=title)
+            set_column(name, width=width, anchor=tk.W, stretch=True)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        scrollbar_y = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.tree.yview)
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.configure(yscrollcommand=scrollbar_y.set)
+        self._scrollbar_y = ttk.Scrollbar(
+            tree_container, orient=tk.VERTICAL, command=self.tree.yview
+        )
+        self._scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.configure(yscrollcommand=self._scrollbar_y.set)
 
         scrollbar_x = ttk.Scrollbar(container, orient=tk.HORIZONTAL, command=self.tree.xview)
         scrollbar_x.pack(fill=tk.X, pady=(4, 0))
         self.tree.configure(xscrollcommand=scrollbar_x.set)
 
-        self.tree.bind("<Double-1>", lambda _: self.show_secret())
-        self.tree.bind("<Return>", lambda _: self.show_secret())
+        self.tree.bind("<Double-1>", self._on_activate)
+        self.tree.bind("<Return>", self._on_activate)
 
         button_bar = ttk.Frame(container)
         button_bar.pack(fill=tk.X, pady=(12, 0))
 
-        ttk.Button(button_bar, text="Refresh", command=self.refresh_secrets).pack(
-            side=tk.LEFT, padx=(0, 8)
-        )
-        ttk.Button(button_bar, text="Show Secret", command=self.show_secret).pack(
-            side=tk.LEFT, padx=8
-        )
-        ttk.Button(button_bar, text="Add Secret", command=self.add_secret).pack(
-            side=tk.LEFT, padx=8
-        )
-        ttk.Button(button_bar, text="Delete Secret", command=self.delete_secret).pack(
-            side=tk.LEFT, padx=8
-        )
-        ttk.Button(button_bar, text="Rotate", command=self.rotate_secrets).pack(
-            side=tk.LEFT, padx=8
-        )
+        for position, (label, handler) in enumerate(self.BUTTONS):
+            button = ttk.Button(button_bar, text=label, command=getattr(self, handler))
+            button.pack(side=tk.LEFT, padx=8 if position else (0, 8))
+            if handler == "_schedule_refresh":
+                self._refresh_button = button
 
-        status_bar = ttk.Label(container, textvariable=self.status_var, anchor=tk.W)
-        status_bar.pack(fill=tk.X, pady=(12, 0))
+        self.status_label = ttk.Label(container, text="Ready", anchor=tk.W)
+        self.status_label.pack(fill=tk.X, pady=(12, 0))
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    def _selected_item(self) -> Optional[tuple[str, str, Optional[str]]]:
+    def _on_activate(self, _event: tk.Event) -> None:
+        self.show_secret()
+
+    def _set_status(self, text: str, *, throttle: bool = False) -> None:
+        """Show *text* in the status bar; throttled updates may be coalesced."""
+
+        now = time.monotonic()
+        if throttle and now - self._status_shown_at < self.STATUS_INTERVAL:
+            self._pending_status = text
+            if self._status_flush_id is None:
+                delay = int(self.STATUS_INTERVAL * 1000)
+                self._status_flush_id = self.root.after(delay, self._flush_status)
+            return
+        self._pending_status = None
+        self._status_shown_at = now
+        self.status_label.configure(text=text)
+
+    def _flush_status(self) -> None:
+        self._status_flush_id = None
+        if self._pending_status is not None:
+            self._set_status(self._pending_status)
+
+    def _selected_item(self) -> Optional[tuple[str, str]]:
         selection = self.tree.selection()
         if not selection:
-            self.status_var.set("Select a secret first.")
+            self._set_status("Select a secret first.")
             messagebox.showinfo("GNOMAN", "Select a secret first.")
             return None
-        item_id = selection[0]
-        return self._items.get(item_id)
+        return self._keys.get(selection[0])
+
+    def _remember(self, item_id: str, service: str, username: str) -> None:
+        # Many accounts share a service namespace; keep one string per name.
+        key = (sys.intern(service), sys.intern(username))
+        self._rows[key] = item_id
+        self._keys[item_id] = key
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(self.REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_after_id = None
+        self.refresh_secrets()
 
     def refresh_secrets(self) -> None:
         """Reload keyring entries from the :class:`SecretsManager`."""
 
-        for item_id in self.tree.get_children():
-            self.tree.delete(item_id)
-        self._items.clear()
-        self.status_var.set("Refreshing secrets…")
+        if self._loading:
+            # Coalesce rapid clicks: one more load runs once this one lands.
+            self._reload_pending = True
+            return
+        cached = self._list_cache
+        if cached is not None and time.monotonic() - cached[0] < self.LIST_TTL:
+            self._apply_records(cached[1])
+            return
+        self._loading = True
+        self._set_status("Refreshing secrets…")
+        self.root.configure(cursor="watch")
+        self._refresh_button.state(["disabled"])
+        future = self._pool.submit(self.manager.list)
+        # Tk calls must stay on the Tk thread, so poll the future from there
+        # rather than scheduling from the worker's done callback.
+        self.root.after(self.LOAD_POLL_MS, self._poll_load, future)
+
+    def _poll_load(self, future: Future[List[SecretRecord]]) -> None:
+        if not future.done():
+            self.root.after(self.LOAD_POLL_MS, self._poll_load, future)
+            return
+        self._on_records_loaded(future)
+
+    def _on_records_loaded(self, future: Future[List[SecretRecord]]) -> None:
+        self._loading = False
+        if self._reload_pending:
+            # The keyring changed (or the user asked again) mid-load; this
+            # result is already stale, so fetch once more instead.
+            self._reload_pending = False
+            self.refresh_secrets()
+            return
+        self.root.configure(cursor="")
+        self._refresh_button.state(["!disabled"])
         try:
-            records = self.manager.list(include_values=True)
+            records = future.result()
         except Exception as exc:  # pragma: no cover - UI guard
             messagebox.showerror("GNOMAN", f"Failed to list secrets: {exc}")
-            self.status_var.set(f"Failed to load secrets: {exc}")
+            self._set_status(f"Failed to load secrets: {exc}")
+            return
+        # Decorate-sort-undecorate: casefold each field exactly once. The
+        # position breaks ties so records themselves are never compared.
+        decorated = [
+            (record.service.casefold(), record.username.casefold(), position, record)
+            for position, record in enumerate(records)
+        ]
+        decorated.sort()
+        records = [item[3] for item in decorated]
+        self._list_cache = (time.monotonic(), records)
+        self._apply_records(records)
+
+    def _invalidate_cache(self) -> None:
+        self._list_cache = None
+
+    def _can_patch(self) -> bool:
+        # The displayed rows mirror the cached listing only once it has been
+        # fully applied; otherwise fall back to a regular refresh.
+        return not (self._loading or self._streaming or self._list_cache is None)
+
+    def _patch_added(self, service: str, username: str) -> bool:
+        """Insert a single row in place of a full refresh."""
+
+        if not self._can_patch():
+            return False
+        if (service, username) in self._rows:
+            return True  # Overwrote an existing secret; the masked row is unchanged.
+        records = self._list_cache[1]
+        record = SecretRecord(service=service, username=username)
+        index = bisect.bisect_right(records, _sort_key(record), key=_sort_key)
+        records.insert(index, record)
+        item_id = self.tree.insert("", index, values=(service, username, self.MASK))
+        self._remember(item_id, service, username)
+        return True
+
+    def _patch_deleted(self, service: str, username: str) -> bool:
+        """Drop a single row in place of a full refresh."""
+
+        if not self._can_patch():
+            return False
+        item_id = self._rows.pop((service, username), None)
+        if item_id is None:
+            return False
+        del self._keys[item_id]
+        del self._list_cache[1][self.tree.index(item_id)]
+        self.tree.delete(item_id)
+        return True
+
+    def _apply_records(self, records: List[SecretRecord]) -> None:
+        """Patch the tree so it mirrors *records*, touching only changed rows."""
+
+        wanted = {(record.service, record.username) for record in records}
+        stale = [self._rows.pop(key) for key in [key for key in self._rows if key not in wanted]]
+        if stale:
+            # One Tcl round-trip for the whole batch instead of one per row.
+            self.tree.delete(*stale)
+            for item_id in stale:
+                del self._keys[item_id]
+        self._streaming = True
+        self._set_stretch(False)
+        self._apply_token += 1
+        self._apply_chunk(records, 0, self._apply_token)
+
+    def _set_stretch(self, stretch: bool) -> None:
+        # Column widths stay frozen while rows stream in and are only
+        # redistributed once the tree is complete.
+        for name, _, _ in self.COLUMNS:
+            self.tree.column(name, stretch=stretch)
+
+    def _apply_chunk(self, records: List[SecretRecord], start: int, token: int) -> None:
+        if token != self._apply_token:
+            return  # A newer refresh superseded this one.
+        stop = min(start + self.APPLY_CHUNK, len(records))
+        # Detach the scrollbar while rows change so it is updated once per
+        # chunk rather than once per inserted or moved row.
+        self.tree.configure(yscrollcommand="")
+        # Tk copies ``values`` into Tcl on insert, so one buffer serves every row.
+        values = [None, None, self.MASK]
+        for index in range(start, stop):
+            record = records[index]
+            key = (record.service, record.username)
+            item_id = self._rows.get(key)
+            if item_id is None:
+                values[0] = record.service
+                values[1] = record.username
+                item_id = self.tree.insert("", index, values=values)
+                self._remember(item_id, record.service, record.username)
+            elif self.tree.index(item_id) != index:
+                self.tree.move(item_id, "", index)
+        self.tree.configure(yscrollcommand=self._scrollbar_y.set)
+        self._scrollbar_y.set(*self.tree.yview())
+        if stop < len(records):
+            self._set_status(f"Loading secrets… {stop}/{len(records)}", throttle=True)
+            self.root.after_idle(self._apply_chunk, records, stop, token)
             return
+        self._streaming = False
+        self._set_stretch(True)
         if not records:
-            self.status_var.set("No secrets stored in the keyring yet.")
+            self._set_status("No secrets stored in the keyring yet.")
             return
-        records.sort(key=lambda record: (record.service.casefold(), record.username.casefold()))
-        for record in records:
-            masked = "•" * len(record.secret or "") if record.secret else "—"
-            item_id = self.tree.insert(
-                "",
-                tk.END,
-                values=(record.service, record.username, masked),
-            )
-            self._items[item_id] = (record.service, record.username, record.secret)
-        self.status_var.set(f"Loaded {len(records)} secret(s).")
+        self._set_status(f"Loaded {len(records)} secret(s).")
 
     def show_secret(self) -> None:
         entry = self._selected_item()
         if not entry:
             return
-        service, username, secret = entry
+        service, username = entry
+        try:
+            record = self.manager.get(service=service, username=username)
+        except Exception as exc:  # pragma: no cover - UI guard
+            messagebox.showerror("GNOMAN", f"Failed to read secret: {exc}")
+            self._set_status(f"Failed to read secret: {exc}")
+            return
+        secret = record.secret if record else None
         message = (
             f"Service: {service}\nUser: {username}\n\nSecret:\n{secret or 'No value stored.'}"
         )
         messagebox.showinfo("Stored Secret", message)
-        self.status_var.set(f"Displayed secret for {service}/{username}.")
+        self._set_status(f"Displayed secret for {service}/{username}.")
 
     def add_secret(self) -> None:
-        service = simpledialog.askstring("Add Secret", "Service namespace:", parent=self.root)
-        if service is None:
-            self.status_var.set("Add secret cancelled.")
-            return
-        if not service:
+        values = _AddSecretDialog(self.root).show()
+        if values is None:
+            self._set_status("Add secret cancelled.")
             return
-        service = service.strip()
+        service, username, secret = values[0].strip(), values[1].strip(), values[2]
         if not service:
             messagebox.showerror("GNOMAN", "Service namespace cannot be empty.")
-            self.status_var.set("Add secret cancelled: missing service namespace.")
-            return
-        username = simpledialog.askstring("Add Secret", "Username:", parent=self.root)
-        if username is None:
-            self.status_var.set("Add secret cancelled.")
-            return
-        if not username:
+            self._set_status("Add secret cancelled: missing service namespace.")
             return
-        username = username.strip()
         if not username:
             messagebox.showerror("GNOMAN", "Username cannot be empty.")
-            self.status_var.set("Add secret cancelled: missing username.")
-            return
-        secret = simpledialog.askstring(
-            "Add Secret",
-            "Secret value:",
-            show="*",
-            parent=self.root,
-        )
-        if secret is None:
-            self.status_var.set("Add secret cancelled.")
+            self._set_status("Add secret cancelled: missing username.")
             return
         try:
             self.manager.add(service=service, username=username, secret=secret)
         except Exception as exc:  # pragma: no cover - UI guard
             messagebox.showerror("GNOMAN", f"Failed to store secret: {exc}")
-            self.status_var.set(f"Failed to store secret: {exc}")
+            self._set_status(f"Failed to store secret: {exc}")
             return
         messagebox.showinfo("GNOMAN", f"Stored credential for {service}/{username}.")
-        self.status_var.set(f"Stored credential for {service}/{username}.")
-        self.refresh_secrets()
+        self._set_status(f"Stored credential for {service}/{username}.")
+        if not self._patch_added(service, username):
+            self._invalidate_cache()
+            self.refresh_secrets()
 
     def delete_secret(self) -> None:
         entry = self._selected_item()
         if not entry:
             return
-        service, username, _ = entry
+        service, username = entry
         if not messagebox.askyesno(
             "Delete Secret", f"Remove the secret for {service}/{username}?"
         ):
-            self.status_var.set("Deletion cancelled.")
+            self._set_status("Deletion cancelled.")
             return
         try:
             self.manager.delete(service=service, username=username)
         except Exception as exc:  # pragma: no cover - UI guard
             messagebox.showerror("GNOMAN", f"Failed to delete secret: {exc}")
-            self.status_var.set(f"Failed to delete secret: {exc}")
+            self._set_status(f"Failed to delete secret: {exc}")
             return
         messagebox.showinfo("GNOMAN", "Secret removed.")
-        self.status_var.set(f"Removed secret for {service}/{username}.")
-        self.refresh_secrets()
+        self._set_status(f"Removed secret for {service}/{username}.")
+        if not self._patch_deleted(service, username):
+            self._invalidate_cache()
+            self.refresh_secrets()
 
     def rotate_secrets(self) -> None:
         service = simpledialog.askstring(
@@ -215,7 +447,7 @@ class SimpleGUI:
             parent=self.root,
         )
         if service is None:
-            self.status_var.set("Rotation cancelled.")
+            self._set_status("Rotation cancelled.")
             return
         length = simpledialog.askinteger(
             "Rotate Secrets",
@@ -225,23 +457,24 @@ class SimpleGUI:
             parent=self.root,
         )
         if length is None:
-            self.status_var.set("Rotation cancelled.")
+            self._set_status("Rotation cancelled.")
             return
         services = [service.strip()] if service and service.strip() else None
         try:
             updated = self.manager.rotate(services=services, length=length)
         except Exception as exc:  # pragma: no cover - UI guard
             messagebox.showerror("GNOMAN", f"Rotation failed: {exc}")
-            self.status_var.set(f"Rotation failed: {exc}")
+            self._set_status(f"Rotation failed: {exc}")
             return
         messagebox.showinfo("GNOMAN", f"Rotated {updated} secret(s).")
         if services:
-            self.status_var.set(
+            self._set_status(
                 f"Rotated {updated} secret(s) in namespace '{services[0]}'."
             )
         else:
-            self.status_var.set(f"Rotated {updated} secret(s) across all namespaces.")
-        self.refresh_secrets()
+            self._set_status(f"Rotated {updated} secret(s) across all namespaces.")
+        # Rotation rewrites values of existing entries only; rows show a fixed
+        # mask and plaintext is fetched on demand, so the tree is still current.
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -249,7 +482,10 @@ class SimpleGUI:
     def run(self) -> None:
         """Start the Tkinter main loop."""
 
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._pool.shutdown(wait=False)
 
 
 def launch() -> None:
@@ -2,36 +2,44 @@
 
 from __future__ import annotations
 
-import json
+import binascii
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from prompt_toolkit.formatted_text import ANSI
 from prompt_toolkit.shortcuts import button_dialog, input_dialog, message_dialog
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from web3 import Web3
-from web3.providers.eth_tester import EthereumTesterProvider
-
-from ..core import (
-    AuditManager,
-    ContractManager,
-    SafeManager,
-    SecretsManager,
-    SyncManager,
-    WalletManager,
-)
-from ..core.sync_manager import SyncReport
-from ..core.wallet_manager import DEFAULT_DERIVATION_PATH
+
 from ..utils import keyring_backend
-from ..core import abi_manager
+from ..utils.json_fast import dumps
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from web3 import Web3
+
+    from ..core import (
+        AuditManager,
+        ContractManager,
+        SafeManager,
+        SecretsManager,
+        SyncManager,
+        WalletManager,
+    )
+    from ..core.sync_manager import SyncReport
+
+# web3, eth-account and eth-tester take about a second to import. They are
+# pulled in by the managers and the ABI module, so those are imported by the
+# code paths that use them rather than when this module loads.
 
 
 class TerminalUI:
     """High level orchestration for the interactive terminal dashboard."""
 
-    MAIN_MENU = [
+    # Menu buttons are static, so build them once instead of on every loop.
+    MAIN_MENU = (
         ("Secrets Vault", "secrets"),
         ("Wallet Hangar", "wallets"),
         ("Safe Operations", "safes"),
@@ -39,16 +47,105 @@ class TerminalUI:
         ("Audit Forge", "audit"),
         ("Sync Recon", "sync"),
         ("Quit", "quit"),
-    ]
+    )
+    SECRETS_MENU = (
+        ("List Secrets", "list"),
+        ("Add Secret", "add"),
+        ("Delete Secret", "delete"),
+        ("Rotate", "rotate"),
+        ("Back", "back"),
+    )
+    WALLETS_MENU = (
+        ("List Wallets", "list"),
+        ("Create Wallet", "create"),
+        ("Import Mnemonic", "import"),
+        ("Export Backup", "export"),
+        ("Import Backup", "restore"),
+        ("Sign Message", "sign"),
+        ("Balance", "balance"),
+        ("Vanity Search", "vanity"),
+        ("Back", "back"),
+    )
+    SAFES_MENU = (
+        ("Deploy Safe", "deploy"),
+        ("Manage Owners", "owners"),
+        ("Submit Transaction", "tx"),
+        ("Back", "back"),
+    )
+    CONTRACTS_MENU = (
+        ("Load Contract", "load"),
+        ("List Stored ABIs", "list"),
+        ("Save ABI", "save"),
+        ("Simulate Call", "call"),
+        ("Back", "back"),
+    )
+    SYNC_MENU = (
+        ("Analyse", "analyse"),
+        ("Reconcile", "reconcile"),
+        ("Keyring Dump", "dump"),
+        ("Back", "back"),
+    )
+
+    SYNC_BUCKETS = ("env_only", "secure_only", "keyring_only", "mismatched")
+    # Keyring dump entries rendered per page.
+    DUMP_PAGE_SIZE = 50
+    # Lists longer than this skip Rich's per-cell table layout.
+    PLAIN_TABLE_THRESHOLD = 50
+    # In-memory tester chain shared by every instance; genesis is expensive.
+    _tester_w3: Optional[Web3] = None
 
     def __init__(self, *, console: Optional[Console] = None) -> None:
         self.console = console or Console(highlight=False)
-        self.secrets = SecretsManager()
-        self.wallets = WalletManager()
-        self.safes = SafeManager()
-        self.contracts = ContractManager()
-        self.audit = AuditManager()
-        self.sync = SyncManager()
+        # Last rendered sync report as (report, console width, dialog body).
+        self._sync_cache: Optional[Tuple[SyncReport, int, ANSI]] = None
+        # HTTP clients keep their connection pool alive between calls.
+        self._w3_cache: Dict[str, Web3] = {}
+        self._handlers: Dict[str, Callable[[], None]] = {
+            value: getattr(self, f"_handle_{value}")
+            for _, value in self.MAIN_MENU
+            if value != "quit"
+        }
+
+    # ------------------------------------------------------------------
+    # Managers
+    # ------------------------------------------------------------------
+    # Built on first use: a session usually visits one or two subsystems, and
+    # several managers import web3 or touch the keyring when constructed.
+    @cached_property
+    def secrets(self) -> SecretsManager:
+        from ..core import SecretsManager
+
+        return SecretsManager()
+
+    @cached_property
+    def wallets(self) -> WalletManager:
+        from ..core import WalletManager
+
+        return WalletManager()
+
+    @cached_property
+    def safes(self) -> SafeManager:
+        from ..core import SafeManager
+
+        return SafeManager()
+
+    @cached_property
+    def contracts(self) -> ContractManager:
+        from ..core import ContractManager
+
+        return ContractManager()
+
+    @cached_property
+    def audit(self) -> AuditManager:
+        from ..core import AuditManager
+
+        return AuditManager()
+
+    @cached_property
+    def sync(self) -> SyncManager:
+        from ..core import SyncManager
+
+        return SyncManager()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -66,11 +163,11 @@ class TerminalUI:
             choice = button_dialog(
                 title="GNOMAN Mission Control",
                 text="Select a subsystem to operate.",
-                buttons=[(label, value) for label, value in self.MAIN_MENU],
+                buttons=self.MAIN_MENU,
             ).run()
             if choice in (None, "quit"):
                 break
-            handler = getattr(self, f"_handle_{choice}", None)
+            handler = self._handlers.get(choice)
             if handler is None:
                 self._show_message("Unavailable", f"No handler for action '{choice}'.")
                 continue
@@ -106,25 +203,77 @@ class TerminalUI:
     def _show_message(self, title: str, text: str) -> None:
         message_dialog(title=title, text=text).run()
 
-    def _show_panel(self, title: str, renderable) -> None:
+    def _capture(self, renderable) -> ANSI:
+        """Render *renderable* into one buffered dialog body."""
+
+        # ``Console.capture`` already buffers every segment and emits the
+        # ANSI text once on exit; all dialog bodies share this single path.
+        # Wrapping it in ``ANSI`` parses the escapes into prompt_toolkit
+        # fragments up front instead of printing them as literal text.
         with self.console.capture() as capture:
-            self.console.print(Panel(renderable, title=title, title_align="left"))
-        message_dialog(title=title, text=capture.get()).run()
+            self.console.print(renderable)
+        return ANSI(capture.get())
+
+    def _show_panel(self, title: str, renderable) -> None:
+        panel = Panel(renderable, title=title, title_align="left")
+        message_dialog(title=title, text=self._capture(panel)).run()
 
     def _render_table(self, title: str, table: Table) -> None:
-        with self.console.capture() as capture:
-            self.console.print(table)
-        message_dialog(title=title, text=capture.get()).run()
+        message_dialog(title=title, text=self._capture(table)).run()
+
+    def _web3_for(self, rpc_url: Optional[str]) -> Web3:
+        from web3 import Web3
+        from web3.providers.eth_tester import EthereumTesterProvider
+
+        if not rpc_url:
+            if TerminalUI._tester_w3 is None:
+                TerminalUI._tester_w3 = Web3(EthereumTesterProvider())
+            return TerminalUI._tester_w3
+        w3 = self._w3_cache.get(rpc_url)
+        if w3 is None:
+            w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
+            self._w3_cache[rpc_url] = w3
+        return w3
+
+    @staticmethod
+    def _decode_payload(text: str) -> bytes:
+        """Decode ``0x``-prefixed hex; anything else is taken as UTF-8 text."""
+
+        text = text.strip()
+        if text[:2] in ("0x", "0X"):
+            return binascii.a2b_hex(text[2:])
+        return text.encode("utf-8")
+
+    @staticmethod
+    def _plain_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> Text:
+        """Lay out *rows* as fixed-width text in a single pass."""
+
+        widths = [len(header) for header in headers]
+        for row in rows:
+            for index, cell in enumerate(row):
+                if len(cell) > widths[index]:
+                    widths[index] = len(cell)
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in (headers, ["─" * width for width in widths], *rows)
+        ]
+        # Rows longer than the panel are cut short instead of wrapping, which
+        # would break the column alignment.
+        return Text("\n".join(lines), no_wrap=True, overflow="ellipsis")
 
     def _render_sync_report(self, report: SyncReport) -> None:
-        table = Table(title="Sync Variance", show_lines=True)
-        table.add_column("Bucket", style="cyan", justify="left")
-        table.add_column("Entries", style="magenta")
-        table.add_row("env_only", json.dumps(report.env_only, indent=2, ensure_ascii=False))
-        table.add_row("secure_only", json.dumps(report.secure_only, indent=2, ensure_ascii=False))
-        table.add_row("keyring_only", json.dumps(report.keyring_only, indent=2, ensure_ascii=False))
-        table.add_row("mismatched", json.dumps(report.mismatched, indent=2, ensure_ascii=False))
-        self._render_table("Sync Recon", table)
+        # Re-entering Sync Recon usually yields an identical report; reuse the
+        # rendered text instead of re-serialising and re-laying out the table.
+        width = self.console.width
+        cached = self._sync_cache
+        if cached is None or cached[1] != width or cached[0] != report:
+            table = Table(title="Sync Variance", show_lines=True)
+            table.add_column("Bucket", style="cyan", justify="left")
+            table.add_column("Entries", style="magenta")
+            for bucket in self.SYNC_BUCKETS:
+                table.add_row(bucket, dumps(getattr(report, bucket)))
+            cached = self._sync_cache = (report, width, self._capture(table))
+        message_dialog(title="Sync Recon", text=cached[2]).run()
 
     # ------------------------------------------------------------------
     # Secrets
@@ -134,27 +283,28 @@ class TerminalUI:
             choice = button_dialog(
                 title="Secrets Vault",
                 text="Manage stored credentials.",
-                buttons=[
-                    ("List Secrets", "list"),
-                    ("Add Secret", "add"),
-                    ("Delete Secret", "delete"),
-                    ("Rotate", "rotate"),
-                    ("Back", "back"),
-                ],
+                buttons=self.SECRETS_MENU,
             ).run()
             if choice in (None, "back"):
                 return
             if choice == "list":
                 records = self.secrets.list(include_values=True)
-                table = Table(title="Stored Secrets", show_header=True, header_style="bold")
-                table.add_column("Service", style="cyan")
-                table.add_column("User", style="green")
-                table.add_column("Secret", style="yellow")
-                for record in records:
-                    table.add_row(record.service, record.username, record.secret or "•" * 4)
-                if not records:
+                rows = [
+                    (record.service, record.username, record.secret or "•" * 4)
+                    for record in records
+                ]
+                if not rows:
                     self._show_message("Secrets", "No secrets stored in the keyring.")
+                elif len(rows) > self.PLAIN_TABLE_THRESHOLD:
+                    headers = ("Service", "User", "Secret")
+                    self._show_panel("Secrets", self._plain_table(headers, rows))
                 else:
+                    table = Table(title="Stored Secrets", show_header=True, header_style="bold")
+                    table.add_column("Service", style="cyan")
+                    table.add_column("User", style="green")
+                    table.add_column("Secret", style="yellow")
+                    for row in rows:
+                        table.add_row(*row)
                     self._render_table("Secrets", table)
             elif choice == "add":
                 service = self._prompt_text("Secrets", "Service namespace")
@@ -198,42 +348,39 @@ class TerminalUI:
     # Wallets
     # ------------------------------------------------------------------
     def _handle_wallets(self) -> None:
+        from ..core.wallet_manager import DEFAULT_DERIVATION_PATH
+
         while True:
             choice = button_dialog(
                 title="Wallet Hangar",
                 text="HD wallet operations.",
-                buttons=[
-                    ("List Wallets", "list"),
-                    ("Create Wallet", "create"),
-                    ("Import Mnemonic", "import"),
-                    ("Export Backup", "export"),
-                    ("Import Backup", "restore"),
-                    ("Sign Message", "sign"),
-                    ("Balance", "balance"),
-                    ("Vanity Search", "vanity"),
-                    ("Back", "back"),
-                ],
+                buttons=self.WALLETS_MENU,
             ).run()
             if choice in (None, "back"):
                 return
             try:
                 if choice == "list":
                     records = self.wallets.list_wallets()
-                    table = Table(title="Wallet Inventory", show_lines=True)
-                    table.add_column("Label", style="cyan")
-                    table.add_column("Address", style="green")
-                    table.add_column("Derivation", style="magenta")
-                    table.add_column("Network", style="yellow")
-                    for record in records:
-                        table.add_row(
+                    rows = [
+                        (
                             record.label,
                             record.address,
                             record.derivation_path,
                             record.network or "—",
                         )
-                    if not records:
+                        for record in records
+                    ]
+                    headers = ("Label", "Address", "Derivation", "Network")
+                    if not rows:
                         self._show_message("Wallets", "No wallets have been provisioned yet.")
+                    elif len(rows) > self.PLAIN_TABLE_THRESHOLD:
+                        self._show_panel("Wallets", self._plain_table(headers, rows))
                     else:
+                        table = Table(title="Wallet Inventory", show_lines=True)
+                        for header, style in zip(headers, ("cyan", "green", "magenta", "yellow")):
+                            table.add_column(header, style=style)
+                        for row in rows:
+                            table.add_row(*row)
                         self._render_table("Wallets", table)
                 elif choice == "create":
                     label = self._prompt_text("Create Wallet", "Wallet label")
@@ -332,11 +479,29 @@ class TerminalUI:
                     signature = self.wallets.sign_message(label=label, message=message)
                     self._show_message("Signature", signature)
                 elif choice == "balance":
-                    label = self._prompt_text("Balance", "Wallet label")
-                    if not label:
+                    raw = self._prompt_text("Balance", "Wallet labels (comma-separated)")
+                    labels = [label.strip() for label in (raw or "").split(",") if label.strip()]
+                    if not labels:
+                        continue
+                    if len(labels) == 1:
+                        payload = self.wallets.balance(label=labels[0])
+                        self._show_panel("Wallet Balance", dumps(payload))
                         continue
-                    payload = self.wallets.balance(label=label)
-                    self._show_panel("Wallet Balance", json.dumps(payload, indent=2, ensure_ascii=False))
+                    balances = self.wallets.balances(labels=labels)
+                    table = Table(title="Wallet Balances", show_lines=True)
+                    for header, style in zip(
+                        ("Label", "Address", "Balance (ETH)", "Nonce"),
+                        ("cyan", "green", "magenta", "yellow"),
+                    ):
+                        table.add_column(header, style=style)
+                    for label, payload in balances.items():
+                        table.add_row(
+                            label,
+                            str(payload["address"]),
+                            str(payload["balance_eth"]),
+                            str(payload["nonce"]),
+                        )
+                    self._render_table("Wallet Balances", table)
                 elif choice == "vanity":
                     pattern = self._prompt_text("Vanity", "Hex pattern (prefix)")
                     if not pattern:
@@ -353,9 +518,7 @@ class TerminalUI:
                         case_sensitive=case_sensitive,
                         max_attempts=attempts,
                     )
-                    self._show_panel(
-                        "Vanity Result", json.dumps(payload, indent=2, ensure_ascii=False)
-                    )
+                    self._show_panel("Vanity Result", dumps(payload))
             except Exception as exc:
                 self._show_message("Wallet Error", f"{type(exc).__name__}: {exc}")
 
@@ -367,12 +530,7 @@ class TerminalUI:
             choice = button_dialog(
                 title="Safe Operations",
                 text="Gnosis Safe management",
-                buttons=[
-                    ("Deploy Safe", "deploy"),
-                    ("Manage Owners", "owners"),
-                    ("Submit Transaction", "tx"),
-                    ("Back", "back"),
-                ],
+                buttons=self.SAFES_MENU,
             ).run()
             if choice in (None, "back"):
                 return
@@ -391,11 +549,7 @@ class TerminalUI:
                     deployment = self.safes.deploy_safe(owners=owners, threshold=threshold)
                     self._show_panel(
                         "Safe Deployed",
-                        json.dumps(
-                            {"address": deployment.address, "tx_hash": deployment.tx_hash},
-                            indent=2,
-                            ensure_ascii=False,
-                        ),
+                        dumps({"address": deployment.address, "tx_hash": deployment.tx_hash}),
                     )
                 elif choice == "owners":
                     safe_address = self._prompt_text("Manage Owners", "Safe address")
@@ -434,7 +588,7 @@ class TerminalUI:
                         safe_address=safe_address,
                         to=to_address,
                         value=value,
-                        data=bytes.fromhex(data_hex[2:]) if data_hex.startswith("0x") else data_hex.encode("utf-8"),
+                        data=self._decode_payload(data_hex),
                         operation=operation,
                     )
                     self._show_message("Safe Tx", f"Transaction hash: {tx_hash}")
@@ -445,17 +599,13 @@ class TerminalUI:
     # Contracts & ABI
     # ------------------------------------------------------------------
     def _handle_contracts(self) -> None:
+        from ..core import abi_manager
+
         while True:
             choice = button_dialog(
                 title="Contracts & ABI Lab",
                 text="Inspect ABI payloads and execute read-only calls.",
-                buttons=[
-                    ("Load Contract", "load"),
-                    ("List Stored ABIs", "list"),
-                    ("Save ABI", "save"),
-                    ("Simulate Call", "call"),
-                    ("Back", "back"),
-                ],
+                buttons=self.CONTRACTS_MENU,
             ).run()
             if choice in (None, "back"):
                 return
@@ -500,7 +650,7 @@ class TerminalUI:
                     if not name:
                         continue
                     payload = abi_manager.load_abi_from_file(path_text)
-                    saved_path = abi_manager.save_abi(name, {"abi": payload})
+                    saved_path = abi_manager.save_abi_binary(name, {"abi": payload})
                     self._show_message("ABI", f"Stored ABI snapshot at {saved_path}")
                 elif choice == "call":
                     name = self._prompt_text(
@@ -515,22 +665,31 @@ class TerminalUI:
                     address = self._prompt_text("Simulate Call", "Contract address")
                     if not address:
                         continue
-                    method = self._prompt_text("Simulate Call", "Method name")
-                    if not method:
-                        continue
-                    args_text = self._prompt_text(
-                        "Simulate Call", "Arguments (comma separated)", default=""
+                    methods_text = self._prompt_text(
+                        "Simulate Call", "Method name(s), separated by ';'"
                     )
-                    args = [item.strip() for item in args_text.split(",") if item.strip()]
+                    methods = [item.strip() for item in (methods_text or "").split(";") if item.strip()]
+                    if not methods:
+                        continue
+                    calls = []
+                    for method in methods:
+                        prompt = "Arguments (comma separated)"
+                        if len(methods) > 1:
+                            prompt = f"Arguments for {method} (comma separated)"
+                        args_text = self._prompt_text("Simulate Call", prompt, default="") or ""
+                        calls.append(
+                            (method, [item.strip() for item in args_text.split(",") if item.strip()])
+                        )
                     rpc_url = self._prompt_text(
                         "Simulate Call", "RPC URL (blank for tester)", default=""
                     )
-                    if rpc_url:
-                        w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 10}))
+                    w3 = self._web3_for(rpc_url)
+                    if len(calls) == 1:
+                        method, args = calls[0]
+                        result = abi_manager.simulate_call(w3, address, abi_data, method, args)
                     else:
-                        w3 = Web3(EthereumTesterProvider())
-                    result = abi_manager.simulate_call(w3, address, abi_data, method, args)
-                    self._show_panel("Call Result", json.dumps(result, indent=2, ensure_ascii=False))
+                        result = abi_manager.simulate_calls(w3, address, abi_data, calls)
+                    self._show_panel("Call Result", dumps(result))
             except Exception as exc:
                 self._show_message("Contract Error", f"{type(exc).__name__}: {exc}")
 
@@ -554,12 +713,7 @@ class TerminalUI:
         choice = button_dialog(
             title="Sync Recon",
             text="Synchronise environment credentials",
-            buttons=[
-                ("Analyse", "analyse"),
-                ("Reconcile", "reconcile"),
-                ("Keyring Dump", "dump"),
-                ("Back", "back"),
-            ],
+            buttons=self.SYNC_MENU,
         ).run()
         if choice in (None, "back"):
             return
@@ -576,15 +730,36 @@ class TerminalUI:
             report = self.sync.reconcile(update_env=update_env, update_keyring=update_keyring)
             self._render_sync_report(report)
         elif choice == "dump":
-            entries = [
+            self._page_keyring_dump(keyring_backend.list_all_entries())
+
+    def _page_keyring_dump(self, entries: List[keyring_backend.KeyringEntry]) -> None:
+        # Only the visible page is serialised and laid out, so the dialog cost
+        # no longer grows with the size of the keyring.
+        size = self.DUMP_PAGE_SIZE
+        pages = max(1, -(-len(entries) // size))
+        page = 0
+        while True:
+            start = page * size
+            chunk = [
                 {
                     "service": entry.service,
                     "username": entry.username,
                     "metadata": entry.metadata,
                 }
-                for entry in keyring_backend.list_all_entries()
+                for entry in entries[start : start + size]
             ]
-            self._show_panel("Keyring Entries", json.dumps(entries, indent=2, ensure_ascii=False))
+            title = f"Keyring Entries ({page + 1}/{pages})"
+            body = self._capture(Panel(dumps(chunk), title=title, title_align="left"))
+            buttons: List[Tuple[str, int]] = []
+            if page > 0:
+                buttons.append(("Prev", -1))
+            if page < pages - 1:
+                buttons.append(("Next", 1))
+            buttons.append(("Back", 0))
+            step = button_dialog(title=title, text=body, buttons=buttons).run()
+            if not step:
+                return
+            page += step
 
 
 def launch_terminal() -> None:
@@ -1,7 +1,7 @@
 """Utility helpers exposed by GNOMAN."""
 
 from .crypto_tools import sign_payload
-from .env_tools import env_file_paths, get_gnoman_home
+from .env_tools import ensure_gnoman_home, env_file_paths, get_gnoman_home
 from .keyring_backend import (
     KeyringEntry,
     KeyringLibraryAdapter,
@@ -19,6 +19,7 @@ __all__ = [
     "KeyringLibraryAdapter",
     "audit_entries",
     "delete_entry",
+    "ensure_gnoman_home",
     "env_file_paths",
     "get_entry",
     "get_gnoman_home",
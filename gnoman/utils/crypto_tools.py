@@ -6,6 +6,7 @@ import base64
 import json
 import os
 import secrets
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,20 +15,27 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
-from .env_tools import get_gnoman_home
+from .env_tools import ensure_gnoman_home
 
 
 def _audit_key_path() -> Path:
-    base = get_gnoman_home()
-    base.mkdir(parents=True, exist_ok=True)
-    return base / "gnoman_audit_key.pem"
+    return ensure_gnoman_home() / "gnoman_audit_key.pem"
 
 
-def _load_or_create_key() -> Ed25519PrivateKey:
-    path = _audit_key_path()
-    if path.exists():
-        data = path.read_bytes()
-        return serialization.load_pem_private_key(data, password=None)
+@lru_cache(maxsize=4)
+def _parse_key(path: Path, mtime_ns: int) -> Ed25519PrivateKey:
+    # Every ``log_event`` signs its entry; keep the parsed key per file
+    # version instead of re-reading and re-parsing the PEM file on each call.
+    return serialization.load_pem_private_key(path.read_bytes(), password=None)
+
+
+def _load_key(path: Path) -> Ed25519PrivateKey:
+    # Stat on every call so a deleted or replaced key file is never
+    # shadowed by a key that only exists in this process.
+    try:
+        return _parse_key(path, path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
     key = Ed25519PrivateKey.generate()
     pem = key.private_bytes(
         encoding=serialization.Encoding.PEM,
@@ -39,6 +47,10 @@ def _load_or_create_key() -> Ed25519PrivateKey:
     return key
 
 
+def _load_or_create_key() -> Ed25519PrivateKey:
+    return _load_key(_audit_key_path())
+
+
 def sign_payload(payload: Any) -> str:
     """Return a base64 encoded Ed25519 signature for *payload*."""
 
@@ -16,6 +16,15 @@ def get_gnoman_home() -> Path:
     return Path.home() / ".gnoman"
 
 
+def ensure_gnoman_home() -> Path:
+    """Return :func:`get_gnoman_home`, creating the directory if it is missing."""
+
+    # Checked on every call: the directory may be removed mid-session.
+    base = get_gnoman_home()
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
+
 def env_file_paths(root: Path | None = None) -> Dict[str, Path]:
     """Return canonical paths to managed environment files."""
 
@@ -26,4 +35,4 @@ def env_file_paths(root: Path | None = None) -> Dict[str, Path]:
     }
 
 
-__all__ = ["env_file_paths", "get_gnoman_home"]
+__all__ = ["ensure_gnoman_home", "env_file_paths", "get_gnoman_home"]
@@ -0,0 +1,34 @@
+"""Indented JSON rendering for display, accelerated by ``orjson`` when present."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fall back to the standard library
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(payload: Any) -> str:
+    """Serialise *payload* as two-space indented JSON text.
+
+    Values JSON cannot represent natively (``Decimal``, ``Path`` …) are
+    rendered through ``str``. Only use this for human-facing output: the
+    exact bytes differ between the orjson and standard library paths.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those.
+    return json.dumps(payload, indent=2, ensure_ascii=False, default=str)
+
+
+__all__ = ["dumps"]
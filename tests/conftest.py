@@ -8,6 +8,8 @@ from pathlib import Path
 import keyring
 import keyring.backend
 import pytest
+from web3.providers.base import JSONBaseProvider
+from web3.providers.eth_tester import EthereumTesterProvider
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -31,6 +33,28 @@ class MemoryKeyring(keyring.backend.KeyringBackend):
         self._data.pop((service, username), None)
 
 
+class BatchingTesterProvider(JSONBaseProvider):
+    """In-memory tester chain that also answers JSON-RPC batches."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tester = EthereumTesterProvider()
+        self.batches: list[list[str]] = []
+
+    def make_request(self, method, params):  # type: ignore[override]
+        return self.tester.make_request(method, params)
+
+    def make_batch_request(self, requests):  # type: ignore[override]
+        self.batches.append([method for method, _ in requests])
+        return [
+            dict(self.tester.make_request(method, params), id=index)
+            for index, (method, params) in enumerate(requests)
+        ]
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
 @pytest.fixture()
 def isolated_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setenv("GNOMAN_HOME", str(tmp_path))
@@ -45,3 +69,8 @@ def audit_key_env(monkeypatch: pytest.MonkeyPatch) -> str:
     encoded = base64.b64encode(raw).decode("ascii")
     monkeypatch.setenv("GNOMAN-AUDIT-KEY", encoded)
     return encoded
+
+
+@pytest.fixture()
+def batching_provider() -> BatchingTesterProvider:
+    return BatchingTesterProvider()
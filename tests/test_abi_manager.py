@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from web3 import Web3
+from web3.providers.eth_tester import EthereumTesterProvider
+
+from gnoman.core import abi_manager
+
+# Minimal contract whose runtime code returns 42 for any call.
+ANSWER_INIT_CODE = "0x69602a60005260206000f3600052600a6016f3"
+ANSWER_ABI = [
+    {
+        "type": "function",
+        "name": "answer",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+    {
+        "type": "function",
+        "name": "echo",
+        "inputs": [{"name": "value", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+    },
+]
+
+
+def test_simulate_calls_falls_back_without_batching(monkeypatch: pytest.MonkeyPatch) -> None:
+    audited: List[Any] = []
+    monkeypatch.setattr(abi_manager, "_append_audit", lambda *args: audited.append(args))
+    w3 = Web3(EthereumTesterProvider())
+    tx_hash = w3.eth.send_transaction({"from": w3.eth.accounts[0], "data": ANSWER_INIT_CODE})
+    address = w3.eth.get_transaction_receipt(tx_hash)["contractAddress"]
+
+    payloads = abi_manager.simulate_calls(
+        w3, address, ANSWER_ABI, [("answer", []), ("echo", ["7"])]
+    )
+
+    assert [payload["method"] for payload in payloads] == ["answer", "echo"]
+    assert [payload["result"] for payload in payloads] == [42, 42]
+    assert len(audited) == 2
+
+
+def test_list_and_load_abis_follow_disk_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(abi_manager, "ABI_DIRECTORY", tmp_path)
+    assert abi_manager.list_abis() == []
+
+    path = abi_manager.save_abi("answer", ANSWER_ABI)
+    assert abi_manager.list_abis() == ["answer"]
+    assert [entry["name"] for entry in abi_manager.load_abi("answer")] == ["answer", "echo"]
+
+    path.write_text(json.dumps({"abi": ANSWER_ABI[:1]}), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert [entry["name"] for entry in abi_manager.load_abi("answer")] == ["answer"]
+
+
+def test_save_abi_binary_without_msgpack_writes_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(abi_manager, "ABI_DIRECTORY", tmp_path)
+    monkeypatch.setattr(abi_manager, "msgpack", None)
+    (tmp_path / "answer.msgpack").write_bytes(b"\x80")
+
+    path = abi_manager.save_abi_binary("answer", ANSWER_ABI)
+
+    assert path.suffix == ".json"
+    assert not (tmp_path / "answer.msgpack").exists()
+    assert abi_manager.list_abis() == ["answer"]
+    assert abi_manager.load_abi("answer.json")[0]["name"] == "answer"
+
+
+def test_msgpack_snapshots_take_precedence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    msgpack = pytest.importorskip("msgpack")
+    monkeypatch.setattr(abi_manager, "ABI_DIRECTORY", tmp_path)
+    monkeypatch.setattr(abi_manager, "msgpack", msgpack)
+
+    abi_manager.save_abi("answer", ANSWER_ABI[:1])
+    path = abi_manager.save_abi_binary("answer", ANSWER_ABI)
+
+    assert path.name == "answer.msgpack"
+    assert msgpack.unpackb(path.read_bytes(), raw=False)["abi"] == ANSWER_ABI
+    assert not (tmp_path / "answer.json").exists()
+    assert abi_manager.list_abis() == ["answer"]
+    assert [entry["name"] for entry in abi_manager.load_abi("answer")] == ["answer", "echo"]
+
+    # A JSON copy dropped in by hand is shadowed by the binary snapshot.
+    (tmp_path / "answer.json").write_text(json.dumps({"abi": ANSWER_ABI[:1]}), encoding="utf-8")
+    assert len(abi_manager.load_abi("answer")) == 2
+
+    abi_manager.save_abi("answer", ANSWER_ABI[:1])
+    assert not path.exists()
+    assert [entry["name"] for entry in abi_manager.load_abi("answer")] == ["answer"]
+
+
+def test_simulate_calls_audits_invalid_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+    audited: List[Any] = []
+    monkeypatch.setattr(abi_manager, "_append_audit", lambda *args: audited.append(args))
+    w3 = Web3(EthereumTesterProvider())
+    address = w3.eth.accounts[1]
+
+    with pytest.raises(ValueError):
+        abi_manager.simulate_calls(w3, address, ANSWER_ABI, [("echo", ["nope"]), ("answer", [])])
+
+    assert [(entry[0], entry[2]) for entry in audited] == [("abi.test", False)]
+    assert "error" in audited[0][3]
+
+
+def test_simulate_calls_sends_one_batch(batching_provider, monkeypatch: pytest.MonkeyPatch) -> None:
+    audited: List[Any] = []
+    monkeypatch.setattr(abi_manager, "_append_audit", lambda *args: audited.append(args))
+    # Deploy through the plain tester; it fills in gas for the transaction.
+    deployer = Web3(batching_provider.tester)
+    tx_hash = deployer.eth.send_transaction({"from": deployer.eth.accounts[0], "data": ANSWER_INIT_CODE})
+    address = deployer.eth.get_transaction_receipt(tx_hash)["contractAddress"]
+    w3 = Web3(batching_provider)
+    w3.eth.default_account = deployer.eth.accounts[0]
+
+    payloads = abi_manager.simulate_calls(
+        w3, address, ANSWER_ABI, [("answer", []), ("echo", ["7"]), ("answer", [])]
+    )
+
+    assert batching_provider.batches == [["eth_call"] * 3]
+    assert [(payload["method"], payload["result"]) for payload in payloads] == [
+        ("answer", 42),
+        ("echo", 42),
+        ("answer", 42),
+    ]
+    assert [(entry[0], entry[1]["method"], entry[2]) for entry in audited] == [
+        ("abi.test", "answer", True),
+        ("abi.test", "echo", True),
+        ("abi.test", "answer", True),
+    ]
+
+
+def test_save_abi_replaces_cached_load_with_unchanged_mtime(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(abi_manager, "ABI_DIRECTORY", tmp_path)
+    first = [dict(ANSWER_ABI[0], name="alpha")]
+    second = [dict(ANSWER_ABI[0], name="gamma")]
+
+    path = abi_manager.save_abi("answer", first)
+    stat = path.stat()
+    assert abi_manager.load_abi("answer")[0]["name"] == "alpha"
+
+    # Same size, and the mtime pinned as a coarse-timestamp filesystem would.
+    abi_manager.save_abi("answer", second)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert path.stat().st_size == stat.st_size
+    assert abi_manager.load_abi("answer")[0]["name"] == "gamma"
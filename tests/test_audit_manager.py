@@ -15,3 +15,17 @@ def test_audit_report_generation(isolated_home: Path, audit_key_env: str, tmp_pa
     data = json.loads(Path(path).read_text(encoding="utf-8"))
     assert "signature" in data
     assert data["keyring"]["total"] >= 1
+
+
+def test_log_event_recreates_removed_home(isolated_home: Path, audit_key_env: str) -> None:
+    import shutil
+
+    from gnoman.core.log_manager import log_event
+
+    log_event("test.first")
+    shutil.rmtree(isolated_home)
+
+    log_event("test.second")
+    lines = (isolated_home / "gnoman_audit.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["test.second"]
+    assert (isolated_home / "gnoman_audit_key.pem").exists()
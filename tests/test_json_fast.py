@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from gnoman.utils import json_fast
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_dumps_round_trips_display_payloads(backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+        assert json_fast.orjson is not None
+    else:
+        monkeypatch.setattr(json_fast, "orjson", None)
+    payload = {"label": "ops", "balance_eth": Decimal("1.5"), 7: {"ok": True}}
+
+    rendered = json_fast.dumps(payload)
+
+    assert json.loads(rendered) == {"label": "ops", "balance_eth": "1.5", "7": {"ok": True}}
+    assert "\n  " in rendered
+
+
+def test_dumps_handles_integers_beyond_64_bits() -> None:
+    # orjson rejects these; dumps must fall back to the standard library.
+    payload = {"balance_wei": 2**70}
+    assert json.loads(json_fast.dumps(payload)) == payload
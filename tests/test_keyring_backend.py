@@ -18,6 +18,8 @@ def test_secret_roundtrip_and_rotation(isolated_home: Path) -> None:
         records = manager.list(include_values=True)
         assert len(records) == 1
         assert records[0].secret == "value"
+        fetched = manager.get(service="service", username="user")
+        assert fetched is not None and fetched.secret == "value"
 
         rotated = manager.rotate(length=16)
         assert rotated == 1
@@ -27,6 +29,7 @@ def test_secret_roundtrip_and_rotation(isolated_home: Path) -> None:
 
         manager.delete(service="service", username="user")
         assert manager.list() == []
+        assert manager.get(service="service", username="user") is None
 
 
 def test_audit_reports_stale(isolated_home: Path) -> None:
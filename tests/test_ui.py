@@ -14,3 +14,33 @@ def test_terminal_ui_menu_labels() -> None:
     assert "Secrets Vault" in labels
     assert "Wallet Hangar" in labels
     assert labels[-1] == "Quit"
+
+
+def test_terminal_ui_dispatches_every_menu_entry() -> None:
+    ui = TerminalUI()
+    assert set(ui._handlers) == {value for _, value in ui.MAIN_MENU} - {"quit"}
+    # Building the dispatch table must not construct the lazy managers.
+    assert "secrets" not in vars(ui)
+
+
+def test_terminal_ui_decodes_safe_payloads() -> None:
+    assert TerminalUI._decode_payload(" 0XdeadBEEF\n") == b"\xde\xad\xbe\xef"
+    assert TerminalUI._decode_payload("0x") == b""
+    assert TerminalUI._decode_payload("memo") == b"memo"
+    with pytest.raises(ValueError):
+        TerminalUI._decode_payload("0xabc")
+
+
+def test_plain_table_keeps_one_line_per_row() -> None:
+    from rich.console import Console
+    from rich.panel import Panel
+
+    rows = [(f"wallet-{index}", "0x" + "ab" * 20, "m/44'/60'/0'/0/0", "mainnet") for index in range(60)]
+    text = TerminalUI._plain_table(("Label", "Address", "Derivation", "Network"), rows)
+    console = Console(width=80, color_system=None)
+    with console.capture() as capture:
+        console.print(Panel(text))
+    lines = capture.get().splitlines()
+    # Header, rule and every row stay on their own line inside the borders.
+    assert len(lines) == len(rows) + 4
+    assert all(len(line) == 80 for line in lines)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+from web3 import Web3
+
 from gnoman.core.wallet_manager import WalletManager
 from gnoman.utils import keyring_backend
 
@@ -31,3 +34,55 @@ def test_wallet_export_import_backup(isolated_home: Path, tmp_path: Path) -> Non
     restored = manager.import_backup(path=target, passphrase="exportpass")
     assert restored.label == "backup"
     assert restored.address == record.address
+
+
+def test_generate_vanity_matches_account_derivation(isolated_home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from eth_account import Account
+
+    from gnoman.core import wallet_manager
+
+    manager = WalletManager()
+    for backend in (wallet_manager._CoincurvePublicKey, None):
+        monkeypatch.setattr(wallet_manager, "_CoincurvePublicKey", backend)
+        payload = manager.generate_vanity("0xA", case_sensitive=True, max_attempts=10_000)
+        address = str(payload["address"])
+        assert address[2] == "A"
+        assert Account.from_key(bytes.fromhex(str(payload["private_key"]))).address == address
+
+
+def test_generate_vanity_case_sensitive_lowercase_pattern(isolated_home: Path) -> None:
+    manager = WalletManager()
+    for _ in range(10):
+        payload = manager.generate_vanity("ab", case_sensitive=True, max_attempts=50_000)
+        assert str(payload["address"])[2:4] == "ab"
+
+
+def test_balances_fall_back_to_single_queries(isolated_home: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = WalletManager()
+    first = manager.create_wallet(label="one")
+    second = manager.create_wallet(label="two")
+
+    loads: list[str] = []
+    load_account = manager._load_account
+    monkeypatch.setattr(manager, "_load_account", lambda label: loads.append(label) or load_account(label))
+
+    balances = manager.balances(labels=["one", "two"])
+    assert list(balances) == ["one", "two"]
+    assert balances["one"]["address"] == first.address
+    assert balances["two"]["address"] == second.address
+    assert balances["two"]["nonce"] == 0
+    assert loads == ["one", "two"]
+
+
+def test_balances_use_a_single_batch(isolated_home: Path, batching_provider) -> None:
+    manager = WalletManager()
+    first = manager.create_wallet(label="one")
+    manager.create_wallet(label="two")
+    manager._web3 = Web3(batching_provider)
+
+    balances = manager.balances(labels=["one", "two"])
+
+    assert batching_provider.batches == [["eth_getBalance", "eth_getTransactionCount"] * 2]
+    assert balances["one"]["address"] == first.address
+    assert balances["one"]["balance_wei"] == 0
+    assert balances["two"]["nonce"] == 0